@@ -1,11 +1,117 @@
-import pytest
+import dask.array as dsa
+import numpy as np
 import pandas as pd
+import pytest
+import xarray as xr
 
-@pytest.fixture
-def sample_points():
+# Seeded so the sample data is reproducible across runs and workers
+RNG = np.random.default_rng(0)
+
+# Sample grid coordinates, shared by every sample DataArray
+_LAT = np.arange(-2, 3, dtype=np.float64)
+_LON = _LAT
+_DEPTH = np.arange(0, 10, dtype=np.float64)
+_TIME = np.arange(
+    np.datetime64("2020-01-01"),
+    np.datetime64("2020-01-31"),
+    np.timedelta64(1, "D"))
+
+def get_2d_gridded_da():
+    """Create a sample Xarray dataset."""
+    lat, lon = _LAT, _LON
+
+    # Create some random temperature data
+    temperature = 15 + 8 * RNG.standard_normal(
+        size=(len(lat), len(lon)), dtype=np.float32
+        )
+
+    # Define the data in an xarray dataset
+    da = xr.DataArray(
+        data=temperature,
+        coords={
+            "lat": lat,
+            "lon": lon,
+        },
+    )
+    return da
+
+def get_2d_gridded_ones_da():
+    """Create a sample Xarray dataset full of ones."""
+    lat, lon = _LAT, _LON
+
+    # Create a flat array full of 1s (read-only broadcast view, no copy)
+    temperature = np.broadcast_to(np.float32(1.0), (len(lat), len(lon)))
+
+    # Define the data in an xarray dataset
+    da = xr.DataArray(
+        data=temperature,
+        coords={
+            "lat": lat,
+            "lon": lon,
+        },
+    )
+    return da
+
+def get_3d_gridded_da(da_2d: xr.DataArray):
+    """Create a sample Xarray dataset with a time dimension from a 2D one."""
+    lat, lon, time = _LAT, _LON, _TIME
+
+    # Broadcast the 2D field along time and perturb it at each timestep
+    temperature = da_2d.values[:, :, np.newaxis] + RNG.standard_normal(
+        size=(1, 1, len(time)), dtype=np.float32
+        )
+
+    # Define the data in an xarray dataset
+    da = xr.DataArray(
+        data=temperature,
+        coords={
+            "lat": lat,
+            "lon": lon,
+            "time": time,
+        },
+    )
+    return da
+
+def get_4d_gridded_da():
+    """Create a sample Xarray dataset with time and depth dimensions."""
+    lat, lon, depth, time = _LAT, _LON, _DEPTH, _TIME
+
+    # Create some random temperature data
+    # Dask-backed so that only the indexed blocks are ever materialized
+    shape = (len(lat), len(lon), len(depth), len(time))
+    temperature = dsa.from_array(
+        15 + 8 * RNG.standard_normal(size=shape, dtype=np.float32),
+        chunks=shape,
+        )
+
+    # Define the data in an xarray dataset
+    da = xr.DataArray(
+        data=temperature,
+        coords={
+            "lat": lat,
+            "lon": lon,
+            "depth": depth,
+            "time": time,
+        },
+    )
+    return da
+
+@pytest.fixture(scope="session", autouse=True)
+def _import_xscape():
+    """Import XScape (and register its accessors) once per session."""
+    import xscape
+    return xscape
+
+# Session-scoped builders: each sample object is built once and shared, so
+# only fixtures that never modify them (e.g. class-scoped XScape DataArrays)
+# should request these directly. Tests get their own copies through the
+# public function-scoped fixtures below.
+
+@pytest.fixture(scope="session")
+def _sample_points():
     """
     Setup sample points.
-    
+
     In conjuction with the sample DataArray, we have two points in the center
     pixel (0,0) and also a point outside of the grid (-3,-3)
     """
@@ -13,4 +119,74 @@ def sample_points():
         "lat": [-3, -1, 0, 0.1, 1],
         "lon": [-3, 1, 0, -0.1, -1]
         })
-    yield points
\ No newline at end of file
+    yield points
+
+@pytest.fixture(scope="session")
+def _sample_points_with_time():
+    """
+    Setup sample points with time indeces.
+    """
+    points = pd.DataFrame({
+        "lat": [-3, -1, 0, 0, 0.1, 1],
+        "lon": [-3, 1, 0, 0, -0.1, -1],
+        "time": [
+            np.datetime64("2020-01-04"),
+            np.datetime64("2020-01-04"),
+            np.datetime64("2020-01-09"),
+            np.datetime64("2020-01-13"),
+            np.datetime64("2020-01-13"),
+            np.datetime64("2020-01-19"),
+            ]
+        })
+    yield points
+
+@pytest.fixture(scope="session")
+def _sample_var_da():
+    """Setup test data."""
+    var_da = get_2d_gridded_da()
+    yield var_da
+
+@pytest.fixture(scope="session")
+def _sample_var_da_with_time(_sample_var_da):
+    var_da = get_3d_gridded_da(_sample_var_da)
+    yield var_da
+
+@pytest.fixture(scope="session")
+def _sample_var_da_with_depth():
+    var_da = get_4d_gridded_da()
+    yield var_da
+
+@pytest.fixture(scope="session")
+def _sample_ones_var_da():
+    var_da = get_2d_gridded_ones_da()
+    yield var_da
+
+@pytest.fixture
+def sample_points(_sample_points):
+    """Copy of the sample points, safe to modify."""
+    return _sample_points.copy()
+
+@pytest.fixture
+def sample_points_with_time(_sample_points_with_time):
+    """Copy of the sample points with time, safe to modify."""
+    return _sample_points_with_time.copy()
+
+@pytest.fixture
+def sample_var_da(_sample_var_da):
+    """Copy of the 2D sample DataArray, safe to modify."""
+    return _sample_var_da.copy(deep=True)
+
+@pytest.fixture
+def sample_var_da_with_time(_sample_var_da_with_time):
+    """Copy of the sample DataArray with time, safe to modify."""
+    return _sample_var_da_with_time.copy(deep=True)
+
+@pytest.fixture
+def sample_var_da_with_depth(_sample_var_da_with_depth):
+    """Copy of the sample DataArray with time and depth, safe to modify."""
+    return _sample_var_da_with_depth.copy(deep=True)
+
+@pytest.fixture
+def sample_ones_var_da(_sample_ones_var_da):
+    """Copy of the 2D sample DataArray full of ones, safe to modify."""
+    return _sample_ones_var_da.copy(deep=True)
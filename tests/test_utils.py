@@ -1,3 +1,6 @@
+import datetime
+
+import numpy as np
 import pandas as pd
 
 import xscape as xscp
@@ -9,11 +12,6 @@ max_lat = 45
 min_lon = -90
 max_lon = 90
 
-@pytest.fixture(scope="module")
-def sample_points():
-    points = pd.DataFrame({"lat": [-1, 0, 1], "lon": [1, 0, -1]})
-    yield points
-
 def test_generate_points():
     """Test simple point generation."""
     points = xscp.generate_points(
@@ -48,8 +46,36 @@ def test_get_request_extent(sample_points):
     )
     assert extent["maximum_latitude"] == 2.5
     assert extent["maximum_longitude"] == 2.5
-    assert extent["minimum_latitude"] == -2.5
-    assert extent["minimum_longitude"] == -2.5
+    assert extent["minimum_latitude"] == -4.5
+    assert extent["minimum_longitude"] == -4.5
+
+def test_get_request_extent_slices(sample_points, sample_var_da):
+    """Test request extent as slices for cropping a loaded background."""
+    extent = xscp.utils.get_request_extent(
+        sample_points,
+        seascape_size = 1,
+        gridsize = 1,
+        return_slices = True,
+    )
+    assert extent["lat"] == slice(-4.5, 2.5)
+    assert extent["lon"] == slice(-4.5, 2.5)
+    cropped = sample_var_da.sel(extent)
+    assert cropped.sizes == {"lat": 5, "lon": 5}
+
+    # Background with descending latitudes, cropped around the center points
+    descending_da = sample_var_da.isel(lat=slice(None, None, -1))
+    extent = xscp.utils.get_request_extent(
+        sample_points.iloc[2:4],
+        seascape_size = 0,
+        gridsize = 1,
+        return_slices = True,
+        var_da = descending_da,
+    )
+    assert extent["lat"] == slice(1.1, -1)
+    assert extent["lon"] == slice(-1.1, 1)
+    cropped = descending_da.sel(extent)
+    np.testing.assert_array_equal(cropped["lat"], [1, 0, -1])
+    np.testing.assert_array_equal(cropped["lon"], [-1, 0, 1])
 
 def test_get_request_extent_error(sample_points):
     """Test request extent with invalid SS size."""
@@ -58,4 +84,101 @@ def test_get_request_extent_error(sample_points):
             sample_points,
             seascape_size = -1,
             gridsize = 1,
-        )
\ No newline at end of file
+        )
+
+def test_find_nearest_gridpoints():
+    """Test snapping values to an unsorted grid, with ties and outliers."""
+    grid = np.array([2., 0., 1., -1., -2.])
+    values = np.array([-3, -0.5, 0.1, 0.6, 1.5, 5])
+    nearest = xscp.utils.find_nearest_gridpoints(values, grid)
+    np.testing.assert_array_equal(nearest, [-2, -1, 0, 1, 1, 2])
+
+def test_get_gridcenter_time(sample_points_with_time):
+    """Test snapping times to a 2-day grid, with ties to the earlier time."""
+    time_vals = np.arange(
+        np.datetime64("2020-01-01"),
+        np.datetime64("2020-01-31"),
+        np.timedelta64(2, "D"))
+    c_points = xscp.utils.get_gridcenter_time(
+        sample_points_with_time,
+        time_vals
+        )
+    np.testing.assert_array_equal(
+        c_points["time"].values.astype("datetime64[D]"),
+        np.array([
+            "2020-01-03", "2020-01-03", "2020-01-09", "2020-01-13",
+            "2020-01-13", "2020-01-19",
+            ], dtype="datetime64[D]")
+        )
+
+def test_get_gridcenter_time_parsing():
+    """Test snapping times given as strings and as date objects."""
+    time_vals = np.arange(
+        np.datetime64("2020-01-01"),
+        np.datetime64("2020-01-31"),
+        np.timedelta64(1, "D"))
+    dates = pd.DataFrame({
+        "time": ["2020-01-04", "2020-01-09T13:00"],
+        })
+    c_points = xscp.utils.get_gridcenter_time(dates, time_vals)
+    np.testing.assert_array_equal(
+        c_points["time"].values.astype("datetime64[D]"),
+        np.array(["2020-01-04", "2020-01-10"], dtype="datetime64[D]")
+        )
+    dates["time"] = [datetime.date(2020, 1, 4), datetime.date(2020, 1, 9)]
+    c_points = xscp.utils.get_gridcenter_time(dates, time_vals)
+    np.testing.assert_array_equal(
+        c_points["time"].values.astype("datetime64[D]"),
+        np.array(["2020-01-04", "2020-01-09"], dtype="datetime64[D]")
+        )
+
+def test_get_gridcenter_points(sample_points):
+    """Test that points are only merged into unique pixels on request."""
+    grid = np.arange(-2, 3, dtype=np.float64)
+    c_points = xscp.utils.get_gridcenter_points(sample_points, grid, grid)
+    assert len(c_points) == len(sample_points)
+    np.testing.assert_array_equal(c_points["lat"], [-2, -1, 0, 0, 1])
+    c_points = xscp.utils.get_gridcenter_points(
+        sample_points, grid, grid, dedupe=True
+        )
+    assert len(c_points) == len(sample_points) - 1
+
+def test_gather_seascapes():
+    """Test gathering 3x3 seascapes, one of them past the grid's edge."""
+    background = np.arange(25).reshape(5, 5)
+    offsets = np.arange(3) - 1
+    ss_indices = [
+        np.array([[2], [0]]) + offsets, # lat
+        np.array([[1], [2]]) + offsets, # lon
+        ]
+    ss_data, in_grid = xscp.utils.gather_seascapes(background, ss_indices)
+    assert ss_data.shape == (2, 3, 3)
+    np.testing.assert_array_equal(in_grid, [True, False])
+    np.testing.assert_array_equal(ss_data[0], background[1:4, 0:3])
+
+def test_interpolate_seascapes():
+    """Test that a linear field is reproduced, and out-of-grid targets fail."""
+    rel_vals = np.arange(3) - 1.
+    ss_rlat, ss_rlon = np.meshgrid(rel_vals, rel_vals, indexing="ij")
+    ss_data = np.stack([2 * ss_rlat + ss_rlon, ss_rlat - 3 * ss_rlon])
+    target_rlat = np.array([[0.25, -1.], [0.5, 1.]])
+    target_rlon = np.array([[-0.5, 1.], [0., 0.75]])
+    interp_vals = xscp.utils.interpolate_seascapes(
+        ss_data, rel_vals, rel_vals, target_rlat, target_rlon
+        )
+    np.testing.assert_allclose(interp_vals, [
+        2 * target_rlat[0] + target_rlon[0],
+        target_rlat[1] - 3 * target_rlon[1],
+        ])
+    with pytest.raises(ValueError):
+        xscp.utils.interpolate_seascapes(
+            ss_data, rel_vals, rel_vals, target_rlat + 1, target_rlon
+            )
+
+def test_create_empty_seascape_deprecated():
+    """Test that the empty seascape helper still works, with a warning."""
+    rel_vals = np.arange(3) - 1.
+    with pytest.deprecated_call():
+        seascape = xscp.utils.create_empty_seascape(rel_vals, rel_vals)
+    assert seascape.sizes == {"lon": 3, "lat": 3}
+    assert seascape.isnull().all()
@@ -1,272 +1,241 @@
 """Testing the creation of XScape DataArrays."""
 
 import numpy as np
-import pandas as pd
 import xarray as xr
 import xscape as xscp
 import pytest
 
+SEASCAPE_TIMERANGE = np.timedelta64(60, "h") # 2.5 days
+
+@pytest.fixture(scope="class", params=[(0.5, 1), (3, 3)], ids=["1px", "3px"])
+def seascape_case(request):
+    """Seascape size and the expected number of gridpoints per side."""
+    return request.param
 
 @pytest.fixture(scope="module")
-def sample_points_with_time():
-    """
-    Setup sample points with time indeces.
-    """
-    points = pd.DataFrame({
-        "lat": [-3, -1, 0, 0, 0.1, 1],
-        "lon": [-3, 1, 0, 0, -0.1, -1],
-        "time": [
-            np.datetime64("2020-01-04"),
-            np.datetime64("2020-01-04"),
-            np.datetime64("2020-01-09"),
-            np.datetime64("2020-01-13"),
-            np.datetime64("2020-01-13"),
-            np.datetime64("2020-01-19"),
-            ]
-        })
-    yield points
-
-def get_2d_gridded_da():
-    """Create a sample Xarray dataset."""
-    # Create dimensions for the dataset
-    lat = np.arange(-2, 3, dtype=float)
-    lon = np.arange(-2, 3, dtype=float)
-
-    # Create some random temperature data
-    temperature = 15 + 8 * np.random.randn(len(lat), len(lon))
-
-    # Define the data in an xarray dataset
-    da = xr.DataArray(
-        data=temperature,
-        coords={
-            "lat": lat,
-            "lon": lon,
-        },
-    )
-    # define dataset attributes
-    da.attrs.update(
-        {
-            "title": "Sea Surface Temperature",
-            "description": "Generated for testing XScape.",
-            "units": "Celsius",
-        }
-    )
-    return da
-
-def get_3d_gridded_da():
-    """Create a sample Xarray dataset with a time dimension."""
-    # Create dimensions for the dataset
-    lat = np.arange(-2, 3, dtype=float)
-    lon = np.arange(-2, 3, dtype=float)
-    time = np.arange(
-        np.datetime64("2020-01-01"),
-        np.datetime64("2020-01-31"),
-        np.timedelta64(1, "D"))
-
-    # Create some random temperature data
-    temperature = 15 + 8 * np.random.randn(len(lat), len(lon), len(time))
-
-    # Define the data in an xarray dataset
-    da = xr.DataArray(
-        data=temperature,
-        coords={
-            "lat": lat,
-            "lon": lon,
-            "time": time,
-        },
-    )
-    # define dataset attributes
-    da.attrs.update(
-        {
-            "title": "Sea Surface Temperature",
-            "description": "Generated for testing XScape.",
-            "units": "Celsius",
-        }
-    )
-    return da
-
-def get_4d_gridded_da():
-    """Create a sample Xarray dataset with time and depth dimensions."""
-    # Create dimensions for the dataset
-    lat = np.arange(-2, 3, dtype=float)
-    lon = np.arange(-2, 3, dtype=float)
-    depth = np.arange(0, 10, dtype=float)
-    time = np.arange(
-        np.datetime64("2020-01-01"),
-        np.datetime64("2020-01-31"),
-        np.timedelta64(1, "D"))
-
-    # Create some random temperature data
-    temperature = 15 + 8 * np.random.randn(
-        len(lat), len(lon), len(depth), len(time)
-        )
+def center_point(_sample_points):
+    """Point in the center pixel (0,0) of the sample grid."""
+    return _sample_points.iloc[2].copy()
 
-    # Define the data in an xarray dataset
-    da = xr.DataArray(
-        data=temperature,
-        coords={
-            "lat": lat,
-            "lon": lon,
-            "depth": depth,
-            "time": time,
-        },
-    )
-    # define dataset attributes
-    da.attrs.update(
-        {
-            "title": "Sea Surface Temperature",
-            "description": "Generated for testing XScape.",
-            "units": "Celsius",
-        }
-    )
-    return da
+@pytest.fixture(scope="module")
+def out_of_grid_point(_sample_points):
+    """Point outside of the sample grid."""
+    return _sample_points.iloc[0].copy()
 
 @pytest.fixture(scope="module")
-def sample_var_da():
-    """Setup test data."""
-    var_da = get_2d_gridded_da()
-    yield var_da
+def center_point_with_time(_sample_points_with_time):
+    """Point in the center pixel (0,0) of the sample grid, on 2020-01-09."""
+    return _sample_points_with_time.iloc[2].copy()
 
 @pytest.fixture(scope="module")
-def sample_var_da_with_time():
-    var_da = get_3d_gridded_da()
-    yield var_da
+def out_of_grid_point_with_time(_sample_points_with_time):
+    """Point outside of the sample grid, with a timestamp."""
+    return _sample_points_with_time.iloc[0].copy()
 
 @pytest.fixture(scope="module")
-def sample_var_da_with_depth():
-    var_da = get_4d_gridded_da()
-    yield var_da
+def out_of_time_point(_sample_points_with_time):
+    """Point whose timestamp does not match any seascape."""
+    point = _sample_points_with_time.iloc[0].copy()
+    point['time'] = np.datetime64("2020-01-14")
+    return point
+
+@pytest.fixture(scope="class")
+def xscp_da(seascape_case, _sample_var_da, _sample_points):
+    """XScape DataArray built once per seascape size."""
+    seascape_size, _ = seascape_case
+    return xscp.create_xscp_da(
+        points = _sample_points,
+        seascape_size = seascape_size,
+        var_da = _sample_var_da,
+    )
 
-def test_create_xscp_da(
-    sample_var_da,
-    sample_points,
+@pytest.fixture(scope="class")
+def xscp_da_with_time(
+    seascape_case,
+    _sample_var_da_with_time,
+    _sample_points_with_time,
     ):
-    """Tests creating an XScape DataArray."""
-    with pytest.warns(
-        UserWarning,
-        match=r"Creating empty seascape *"):
-
-        xscp_da = xscp.create_xscp_da(
-            points = sample_points,
-            seascape_size = 3,
-            var_da = sample_var_da,
-        )
-
-    assert xscp_da.sizes["seascape_idx"] == 4
-    assert xscp_da.sizes["ss_lat"] == 3
-    assert xscp_da.sizes["ss_lon"] == 3
-    
-    # Testing selection
-    point = sample_points.iloc[2]
-    seascape = xscp_da.xscp.ss_sel(point)
-    assert seascape.c_lon == 0
-    assert seascape.c_lat == 0
-
-    # Test selecting outside of range
-    with pytest.raises(ValueError):
-        point = sample_points.iloc[0]
-        xscp_da.xscp.ss_sel(point)
+    """XScape DataArray with a time dimension built once per seascape size."""
+    seascape_size, _ = seascape_case
+    return xscp.create_xscp_da(
+        points = _sample_points_with_time,
+        seascape_size = seascape_size,
+        var_da = _sample_var_da_with_time,
+        seascape_timerange = SEASCAPE_TIMERANGE,
+    )
 
-def test_create_xscp_da_1px(
-    sample_var_da,
-    sample_points,
+@pytest.fixture(scope="class")
+def xscp_da_with_depth(
+    _sample_var_da_with_depth,
+    _sample_points_with_time,
     ):
-    """Tests creating an XScape DataArray with a single pixel seascape."""
-    xscp_da = xscp.create_xscp_da(
-        points = sample_points,
-        seascape_size = 0.5,
-        var_da = sample_var_da,
+    """XScape DataArray with time and depth dimensions."""
+    return xscp.create_xscp_da(
+        points = _sample_points_with_time,
+        seascape_size = 2,
+        var_da = _sample_var_da_with_depth,
+        seascape_timerange = SEASCAPE_TIMERANGE,
+        get_column = True
     )
 
-    assert xscp_da.sizes["seascape_idx"] == 4
-    assert xscp_da.sizes["ss_lat"] == 1
-    assert xscp_da.sizes["ss_lon"] == 1
-    
-    # Testing selection
-    point = sample_points.iloc[2]
-    seascape = xscp_da.xscp.ss_sel(point)
-    assert seascape.c_lon == 0
-    assert seascape.c_lat == 0
-
-    # Test selecting outside of range
-    with pytest.raises(ValueError):
-        point = sample_points.iloc[0]
-        xscp_da.xscp.ss_sel(point)
+@pytest.mark.filterwarnings("ignore:Creating empty seascape:UserWarning")
+class TestXscpDa:
+    """Tests creating an XScape DataArray."""
 
-def test_create_xscp_da_1px_timerange(
-    sample_var_da_with_time,
+    def test_sizes(self, xscp_da, seascape_case):
+        _, n_ss_gridpoints = seascape_case
+        assert xscp_da.sizes["seascape_idx"] == 4
+        assert xscp_da.sizes["ss_lat"] == n_ss_gridpoints
+        assert xscp_da.sizes["ss_lon"] == n_ss_gridpoints
+
+    def test_ss_sel(self, xscp_da, center_point):
+        seascape = xscp_da.xscp.ss_sel(center_point)
+        assert seascape.c_lon == 0
+        assert seascape.c_lat == 0
+
+    def test_values(self, xscp_da, center_point, sample_var_da):
+        seascape = xscp_da.xscp.ss_sel(center_point)
+        expected = sample_var_da.sel(
+            lat=seascape.ss_lat.values,
+            lon=seascape.ss_lon.values,
+            ).transpose("lon", "lat")
+        np.testing.assert_array_equal(seascape.values, expected.values)
+
+    def test_ss_sel_out_of_range(self, xscp_da, out_of_grid_point):
+        with pytest.raises(ValueError):
+            xscp_da.xscp.ss_sel(out_of_grid_point)
+
+@pytest.mark.filterwarnings("ignore:Creating empty seascape:UserWarning")
+class TestXscpDaTimerange:
+    """Tests creating an XScape DataArray w/ timerange."""
+
+    def test_sizes(self, xscp_da_with_time, seascape_case):
+        _, n_ss_gridpoints = seascape_case
+        assert xscp_da_with_time.sizes["seascape_idx"] == 5
+        assert xscp_da_with_time.sizes["ss_lat"] == n_ss_gridpoints
+        assert xscp_da_with_time.sizes["ss_lon"] == n_ss_gridpoints
+        assert xscp_da_with_time.sizes["ss_time"] == 3
+
+    def test_ss_sel(self, xscp_da_with_time, center_point_with_time):
+        seascape = xscp_da_with_time.xscp.ss_sel(center_point_with_time)
+        assert seascape.c_lon == 0
+        assert seascape.c_lat == 0
+        assert seascape.c_time == np.datetime64("2020-01-09")
+
+    def test_ss_sel_out_of_range(
+        self,
+        xscp_da_with_time,
+        out_of_grid_point_with_time,
+        ):
+        with pytest.raises(ValueError):
+            xscp_da_with_time.xscp.ss_sel(out_of_grid_point_with_time)
+
+    def test_ss_sel_out_of_timerange(self, xscp_da_with_time, out_of_time_point):
+        with pytest.raises(ValueError):
+            xscp_da_with_time.xscp.ss_sel(out_of_time_point)
+
+@pytest.mark.filterwarnings("ignore:Creating empty seascape:UserWarning")
+class TestXscpDaDepth:
+    """Tests creating an XScape DataArray w/ timerange and depth."""
+
+    def test_sizes(self, xscp_da_with_depth):
+        assert xscp_da_with_depth.sizes["seascape_idx"] == 5
+        assert xscp_da_with_depth.sizes["ss_lat"] == 3
+        assert xscp_da_with_depth.sizes["ss_lon"] == 3
+        assert xscp_da_with_depth.sizes["ss_time"] == 3
+        assert xscp_da_with_depth.sizes["depth"] == 10
+
+    def test_ss_sel(self, xscp_da_with_depth, center_point_with_time):
+        seascape = xscp_da_with_depth.xscp.ss_sel(center_point_with_time)
+        assert seascape.c_lon == 0
+        assert seascape.c_lat == 0
+        assert seascape.c_time == np.datetime64("2020-01-09")
+
+    def test_ss_sel_out_of_range(
+        self,
+        xscp_da_with_depth,
+        out_of_grid_point_with_time,
+        ):
+        with pytest.raises(ValueError):
+            xscp_da_with_depth.xscp.ss_sel(out_of_grid_point_with_time)
+
+    def test_ss_sel_out_of_timerange(self, xscp_da_with_depth, out_of_time_point):
+        with pytest.raises(ValueError):
+            xscp_da_with_depth.xscp.ss_sel(out_of_time_point)
+
+@pytest.mark.filterwarnings("ignore:Creating empty seascape:UserWarning")
+def test_create_xscp_da_lazy_background(
+    sample_var_da_with_depth,
     sample_points_with_time,
+    xscp_da_with_depth,
     ):
-    """Tests creating an XScape DA with a 1 pixel seascape w/ timerange."""
+    """Tests extracting seascapes without loading the dask-backed background."""
     xscp_da = xscp.create_xscp_da(
         points = sample_points_with_time,
-        seascape_size = 0.5,
-        var_da = sample_var_da_with_time,
-        seascape_timerange=np.timedelta64(60, "h") # 2.5 days
+        seascape_size = 2,
+        var_da = sample_var_da_with_depth,
+        seascape_timerange = SEASCAPE_TIMERANGE,
+        get_column = True,
+        load_background = False,
     )
+    xr.testing.assert_identical(xscp_da, xscp_da_with_depth)
 
-    assert xscp_da.sizes["seascape_idx"] == 5
-    assert xscp_da.sizes["ss_lat"] == 1
-    assert xscp_da.sizes["ss_lon"] == 1
-    assert xscp_da.sizes["ss_time"] == 3
-    
-    # Testing selection
-    point = sample_points_with_time.iloc[2]
-    seascape = xscp_da.xscp.ss_sel(point)
-    assert seascape.c_lon == 0
-    assert seascape.c_lat == 0
-    assert seascape.c_time == np.datetime64("2020-01-09")
-
-    # Test selecting outside of range
-    with pytest.raises(ValueError):
-        point = sample_points_with_time.iloc[0]
-        xscp_da.xscp.ss_sel(point)
-    
-    # Test selecting outside of timerange
-    with pytest.raises(ValueError):
-        point = sample_points_with_time.iloc[0].copy()
-        point['time'] = np.datetime64("2020-01-14")
-        xscp_da.xscp.ss_sel(point)
-
-def test_create_xscp_da_timerange(
+@pytest.mark.filterwarnings("ignore:Creating empty seascape:UserWarning")
+def test_create_xscp_da_descending_coords(
     sample_var_da_with_time,
     sample_points_with_time,
+    xscp_da_with_time,
+    seascape_case,
     ):
-    """Tests creating an XScape DA with a multi-pixel seascape w/ timerange."""
-    
-    with pytest.warns(
-        UserWarning,
-        match=r"Creating empty seascape *"):
-
-        xscp_da = xscp.create_xscp_da(
-            points = sample_points_with_time,
-            seascape_size = 2,
-            var_da = sample_var_da_with_time,
-            seascape_timerange=np.timedelta64(60, "h") # 2.5 days
+    """Tests that backgrounds with descending coordinates give the same result."""
+    seascape_size, _ = seascape_case
+    xscp_da = xscp.create_xscp_da(
+        points = sample_points_with_time,
+        seascape_size = seascape_size,
+        var_da = sample_var_da_with_time.isel(
+            lat=slice(None, None, -1),
+            time=slice(None, None, -1),
+            ),
+        seascape_timerange = SEASCAPE_TIMERANGE,
+    )
+    xr.testing.assert_identical(xscp_da, xscp_da_with_time)
+
+@pytest.mark.filterwarnings("ignore:Creating empty seascape:UserWarning")
+def test_create_xscp_da_chunks(sample_var_da, sample_points):
+    """Tests that the result is only chunked on request."""
+    kwargs = {
+        "points": sample_points,
+        "seascape_size": 3,
+        "var_da": sample_var_da,
+    }
+    xscp_da = xscp.create_xscp_da(compute_result = False, **kwargs)
+    assert xscp_da.chunks is None
+    for compute_result in (False, True):
+        xscp_da_chunked = xscp.create_xscp_da(
+            compute_result = compute_result,
+            chunks = "auto",
+            **kwargs,
         )
+        assert xscp_da_chunked.chunks is not None
+        xr.testing.assert_identical(xscp_da_chunked.compute(), xscp_da)
 
-    assert xscp_da.sizes["seascape_idx"] == 5
-    assert xscp_da.sizes["ss_lat"] == 3
-    assert xscp_da.sizes["ss_lon"] == 3
-    assert xscp_da.sizes["ss_time"] == 3
-    
-    # Testing selection
-    point = sample_points_with_time.iloc[2]
-    seascape = xscp_da.xscp.ss_sel(point)
-    assert seascape.c_lon == 0
-    assert seascape.c_lat == 0
-    assert seascape.c_time == np.datetime64("2020-01-09")
-
-    # Test selecting outside of range
-    with pytest.raises(ValueError):
-        point = sample_points_with_time.iloc[0]
-        xscp_da.xscp.ss_sel(point)
-    
-    # Test selecting outside of timerange
-    with pytest.raises(ValueError):
-        point = sample_points_with_time.iloc[0].copy()
-        point['time'] = np.datetime64("2020-01-14")
-        xscp_da.xscp.ss_sel(point)
+@pytest.mark.filterwarnings("ignore:Creating empty seascape:UserWarning")
+def test_create_xscp_da_single_precision(sample_var_da, sample_points):
+    """Tests that float64 backgrounds are only downcast on request."""
+    var_da = sample_var_da.astype(np.float64)
+    xscp_da = xscp.create_xscp_da(
+        points = sample_points,
+        seascape_size = 3,
+        var_da = var_da,
+    )
+    assert xscp_da.dtype == np.float32
+    xscp_da = xscp.create_xscp_da(
+        points = sample_points,
+        seascape_size = 3,
+        var_da = var_da,
+        single_precision = False,
+    )
+    assert xscp_da.dtype == np.float64
 
 def test_create_xscp_da_timerange_error(
     sample_var_da_with_time,
@@ -284,51 +253,12 @@ def test_create_xscp_da_timerange_error(
             var_da = sample_var_da_with_time,
         )
 
-def test_create_xscp_da_depth(
-    sample_var_da_with_depth,
-    sample_points_with_time,
-    ):
-    """Tests creating an XScape DA with a multi-pixel seascape w/ depth."""
-    
-    with pytest.warns(
-        UserWarning,
-        match=r"Creating empty seascape *"):
-
-        xscp_da = xscp.create_xscp_da(
-            points = sample_points_with_time,
-            seascape_size = 2,
-            var_da = sample_var_da_with_depth,
-            seascape_timerange=np.timedelta64(60, "h"), # 2.5 days
-            get_column = True
-        )
-
-    assert xscp_da.sizes["seascape_idx"] == 5
-    assert xscp_da.sizes["ss_lat"] == 3
-    assert xscp_da.sizes["ss_lon"] == 3
-    assert xscp_da.sizes["ss_time"] == 3
-    assert xscp_da.sizes["depth"] == 10
-    
-    # Testing selection
-    point = sample_points_with_time.iloc[2]
-    seascape = xscp_da.xscp.ss_sel(point)
-    assert seascape.c_lon == 0
-    assert seascape.c_lat == 0
-    assert seascape.c_time == np.datetime64("2020-01-09")
-
-    # Test selecting outside of range
-    with pytest.raises(ValueError):
-        point = sample_points_with_time.iloc[0]
-        xscp_da.xscp.ss_sel(point)
-    
-    # Test selecting outside of timerange
-    with pytest.raises(ValueError):
-        point = sample_points_with_time.iloc[0].copy()
-        point['time'] = np.datetime64("2020-01-14")
-        xscp_da.xscp.ss_sel(point)
-
 def test_create_xscp_da_depth_warning(
     sample_var_da_with_depth,
     sample_points_with_time,
+    center_point_with_time,
+    out_of_grid_point_with_time,
+    out_of_time_point,
     ):
     """Tests creating an XScape DA with a multi-pixel seascape w/ depth."""
     
@@ -352,19 +282,15 @@ def test_create_xscp_da_depth_warning(
     assert xscp_da.sizes["ss_time"] == 3
     
     # Testing selection
-    point = sample_points_with_time.iloc[2]
-    seascape = xscp_da.xscp.ss_sel(point)
+    seascape = xscp_da.xscp.ss_sel(center_point_with_time)
     assert seascape.c_lon == 0
     assert seascape.c_lat == 0
     assert seascape.c_time == np.datetime64("2020-01-09")
 
     # Test selecting outside of range
     with pytest.raises(ValueError):
-        point = sample_points_with_time.iloc[0]
-        xscp_da.xscp.ss_sel(point)
+        xscp_da.xscp.ss_sel(out_of_grid_point_with_time)
     
     # Test selecting outside of timerange
     with pytest.raises(ValueError):
-        point = sample_points_with_time.iloc[0].copy()
-        point['time'] = np.datetime64("2020-01-14")
-        xscp_da.xscp.ss_sel(point)
\ No newline at end of file
+        xscp_da.xscp.ss_sel(out_of_time_point)
\ No newline at end of file
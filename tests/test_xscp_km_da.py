@@ -1,43 +1,10 @@
 """Testing the creation of XScape DataArrays."""
 
 import numpy as np
-import xarray as xr
 import xscape as xscp
 import pytest
 
-def get_2d_gridded_ones_da():
-    """Create a sample Xarray dataset."""
-    # Create dimensions for the dataset
-    lat = np.arange(-2, 3, dtype=float)
-    lon = np.arange(-2, 3, dtype=float)
-
-    # Create a flat array full of 1s
-    temperature = np.ones((len(lat), len(lon)))
-
-    # Define the data in an xarray dataset
-    da = xr.DataArray(
-        data=temperature,
-        coords={
-            "lat": lat,
-            "lon": lon,
-        },
-    )
-    # define dataset attributes
-    da.attrs.update(
-        {
-            "title": "Sea Surface Temperature",
-            "description": "Generated for testing XScape.",
-            "units": "Celsius",
-        }
-    )
-    return da
-
-@pytest.fixture(scope="module")
-def sample_ones_var_da():
-    """Setup test data."""
-    var_da = get_2d_gridded_ones_da()
-    yield var_da
-
+@pytest.mark.filterwarnings("ignore:Creating empty seascape:UserWarning")
 def test_km_grid_from_angular(
         sample_points,
         sample_ones_var_da,
@@ -63,14 +30,11 @@ def test_km_grid_from_angular(
         )
 
     # Three-pixel seascape
-    with pytest.warns(
-        UserWarning,
-        match=r"Creating empty seascape *"):
-        xscp_da = xscp.create_xscp_da(
-            points = sample_points,
-            seascape_size = 3,
-            var_da = sample_ones_var_da,
-        )
+    xscp_da = xscp.create_xscp_da(
+        points = sample_points,
+        seascape_size = 3,
+        var_da = sample_ones_var_da,
+    )
     
     km_xscp_da = xscp_da.xscp.to_km_grid(
         gridsize=1,
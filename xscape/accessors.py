@@ -7,12 +7,13 @@ import math
 import numpy as np
 import pandas as pd
 import xarray as xr
-from pyproj import Proj, Transformer
-from scipy.interpolate import RegularGridInterpolator
+from pyproj import Geod
 
 import xscape.utils as utils
 
-@xr.register_dataarray_accessor("xscp")
+# Reference ellipsoid used to lay kilometric grids over angular seascapes
+_WGS84_GEOD = Geod(ellps="WGS84")
+
 class XScapeDAAccessor:
     def __init__(self, xarray_obj):
         self._obj = xarray_obj
@@ -141,7 +142,6 @@ class XScapeDAAccessor:
 
         assert gridsize <= extent
 
-        patches = []
         n_ss_gridpoints = math.ceil(extent / gridsize)
         if not (n_ss_gridpoints % 2):
             n_ss_gridpoints += 1 # Must be odd to have a center pixel.
@@ -150,44 +150,43 @@ class XScapeDAAccessor:
         km_x, km_y = np.meshgrid(lin, lin)
 
 
-        for ss_idx in range(self._obj.sizes["seascape_idx"]):
-            c_lat = self.c_points["lat"].iloc[ss_idx]
-            c_lon = self.c_points["lon"].iloc[ss_idx]
-            # Azimuthal Equidistant projection centered on each seascape
-            proj_aeqd = Proj(proj='aeqd', lat_0=c_lat, lon_0=c_lon, units='km')
-            transformer = Transformer.from_proj(
-                "epsg:4326",
-                proj_aeqd,
-                always_xy=True)
-
-            # Get lat/lon for the patch
-            lat = self._obj["ss_lat"].isel(seascape_idx=ss_idx)
-            lon = self._obj["ss_lon"].isel(seascape_idx=ss_idx)
-
-            # Flatten and project grid
-            data_patch = self._obj.isel(seascape_idx=ss_idx).values
-            interpolator = RegularGridInterpolator(
-                (lat, lon),
-                data_patch,
-                bounds_error=True,
-                fill_value=np.nan
-                )
-
-            # Calculate lat/lon for the kilometric grid
-            lon_target, lat_target = transformer.transform(
-                km_x.ravel(),
-                km_y.ravel(),
-                direction="INVERSE"
-                )
-            
-            interp_vals = interpolator(np.stack([lat_target, lon_target], axis=-1))
-            grid_patch = interp_vals.reshape(km_x.shape)
-
-            patches.append(grid_patch)
+        # Calculate lat/lon for the kilometric grid around every seascape at
+        # once. This is the inverse of an Azimuthal Equidistant projection
+        # centered on each seascape, i.e. a direct geodesic problem.
+        n_seascapes = self._obj.sizes["seascape_idx"]
+        km_azimuths = np.degrees(np.arctan2(km_x, km_y)).ravel()
+        km_distances = np.hypot(km_x, km_y).ravel() * 1000 # In meters
+        target_shape = (n_seascapes, km_distances.size)
+        lon_target, lat_target, _ = _WGS84_GEOD.fwd(
+            np.broadcast_to(
+                self.c_points["lon"].values[:, np.newaxis],
+                target_shape
+                ).ravel(),
+            np.broadcast_to(
+                self.c_points["lat"].values[:, np.newaxis],
+                target_shape
+                ).ravel(),
+            np.broadcast_to(km_azimuths, target_shape).ravel(),
+            np.broadcast_to(km_distances, target_shape).ravel(),
+            )
+        lon_target = lon_target.reshape(target_shape)
+        lat_target = lat_target.reshape(target_shape)
+
+        # Interpolate all patches at once, in the relative lat/lon grid
+        # shared by every seascape
+        patches_data = self._obj\
+            .transpose("seascape_idx", "ss_lat", "ss_lon").values
+        interp_vals = utils.interpolate_seascapes(
+            patches_data,
+            self._obj["ss_rlat"].values,
+            self._obj["ss_rlon"].values,
+            lat_target - self.c_points["lat"].values[:, np.newaxis],
+            lon_target - self.c_points["lon"].values[:, np.newaxis],
+            )
 
         # Stack into new DataArray
         out = xr.DataArray(
-            data=np.stack(patches),
+            data=interp_vals.reshape((n_seascapes,) + km_x.shape),
             dims=("seascape_idx", "ss_y", "ss_x"),
             coords={
                 "c_lat": self._obj.coords["c_lat"],
@@ -200,4 +199,9 @@ class XScapeDAAccessor:
         )
         out.attrs["is_kilometric"] = True
         out.attrs["seascape_gridsize"] = gridsize
-        return out
\ No newline at end of file
+        return out
+
+# Only register once, so that re-importing this module (e.g. across test
+# workers) does not trigger xarray's AccessorRegistrationWarning.
+if not hasattr(xr.DataArray, "xscp"):
+    xr.register_dataarray_accessor("xscp")(XScapeDAAccessor)
@@ -7,7 +7,6 @@ import warnings
 import xarray as xr
 import pandas as pd
 import numpy as np
-import copernicusmarine as cmems
 
 import xscape.utils as utils
 
@@ -42,6 +41,9 @@ def get_glorys_ds(
         Dataset in the same format as that returned by `copernicusmarine`.
     """
 
+    # Imported here so that importing XScape does not load copernicusmarine
+    import copernicusmarine as cmems
+
     gridsize = GLORYS_GRIDSIZE
     extent = utils.get_request_extent(
         points,
@@ -111,6 +113,9 @@ def create_xscp_da(
     seascape_timerange: np.timedelta64 | None = None,
     get_column: bool = False,
     compute_result: bool = True,
+    load_background: bool = True,
+    chunks: str | dict | None = None,
+    single_precision: bool = True,
     ) -> xr.DataArray:
     """
     Crops and packages together a series of seascapes.
@@ -123,7 +128,9 @@ def create_xscp_da(
     seascape_size : float
         Size (in degrees) of the seascape around each point.
     var_da : xr.DataArray
-        Gridded background field from which we extract the seascapes.
+        Gridded background field from which we extract the seascapes. Its
+        lat, lon and time coordinates may be in any order, they are sorted
+        when needed.
     seascape_timerange: np.timedelta64, optional
         Duration of the seascape around each point's timestamp. If not an exact
         multiple of the timestep duration, take the minimum number of timesteps
@@ -135,6 +142,23 @@ def create_xscp_da(
         Whether to apply `.compute()` to the final result, which loads it into
         memory. Massively shortens subsequent computations at the cost of a
         higher memory footprint. Defaults to True.
+    load_background: bool, optional
+        Whether to load the whole background field (after selecting the
+        vertical level) into memory before extracting the seascapes. This is
+        much faster when it fits in memory. If False and `var_da` is backed by
+        dask, only the chunks that contain seascapes are read. Defaults to
+        True.
+    chunks: str or dict, optional
+        Chunks (in any form accepted by `xr.DataArray.chunk`, e.g. "auto") in
+        which to split the result, after computing it if `compute_result` is
+        True. If not specified, the result is not rechunked: it stays in
+        memory, or lazy if the background was left lazy and `compute_result`
+        is False.
+    single_precision: bool, optional
+        Whether to cast a float64 background to float32 before extracting the
+        seascapes, halving the memory used by them. Ocean reanalyses such as
+        GLORYS do not carry more than single precision. Other dtypes are left
+        untouched. Defaults to True.
         
     Returns
     -------
@@ -148,6 +172,9 @@ def create_xscp_da(
     ValueError
         When `var_da` has a time dimension but no `seascape_timerange` is
         specified.
+    AttributeError
+        When `seascape_timerange` is specified but `var_da` has no time
+        coordinate.
     """
 
     if (seascape_timerange is None) and ("time" in var_da.dims):
@@ -155,34 +182,54 @@ def create_xscp_da(
             "var_da has a time dimension but seascape_timerange was not "\
             "specified."
             )
-    
+
+    # Seascapes are gathered by position along each axis, which requires
+    # ascending coordinates (e.g. latitudes may be stored north to south)
+    unsorted_dims = [
+        dim for dim in ("lat", "lon", "time")
+        if dim in var_da.dims
+        and not var_da.indexes[dim].is_monotonic_increasing
+        ]
+    if unsorted_dims:
+        var_da = var_da.sortby(unsorted_dims)
+
     vert_dimname = utils.get_vert_dimname(var_da)
     vert_coordname = utils.get_vert_coordname(var_da)
 
-    gridsize = utils.calculate_horizontal_gridsize(var_da)
+    lat_vals = var_da["lat"].values
+    lon_vals = var_da["lon"].values
+    gridsize = float(utils.calculate_horizontal_gridsize(var_da))
     n_ss_gridpoints = math.ceil(seascape_size / gridsize)
     if not (n_ss_gridpoints % 2):
         n_ss_gridpoints += 1 # Must be odd to have a center pixel.
-    c_points = utils.get_gridcenter_points(points, var_da)
+    c_points = utils.get_gridcenter_points(
+        points,
+        lat_vals,
+        lon_vals,
+        dedupe=True,
+        )
     
     # Calculate values in relative seascape grid
-    half_range = (n_ss_gridpoints // 2) * gridsize
-    ss_rlat_vals = np.linspace(-half_range, half_range, n_ss_gridpoints)
-    ss_rlon_vals = np.linspace(-half_range, half_range, n_ss_gridpoints)
+    # Exact multiples of the gridsize, centered on the seascape's center pixel
+    ss_offsets = np.arange(n_ss_gridpoints) - n_ss_gridpoints // 2
+    ss_rlat_vals = ss_offsets * gridsize
+    ss_rlon_vals = ss_offsets * gridsize
 
     if seascape_timerange is not None:
-        c_points = utils.get_gridcenter_time(c_points, var_da)
+        if "time" not in var_da.coords:
+            raise AttributeError(
+                "No time coordinate found in background DataArray."
+                )
+        time_vals = var_da["time"].values
+        c_points = utils.get_gridcenter_time(c_points, time_vals)
         ss_timestep_duration = utils.calculate_timestep_duration(var_da)
         n_ss_timesteps = math.ceil(seascape_timerange / ss_timestep_duration)
         if not (n_ss_timesteps % 2):
             n_ss_timesteps += 1 # Must be odd to have a center time.
         
-        half_t_range = (n_ss_timesteps // 2) * ss_timestep_duration
-        ss_rtime_vals = np.linspace(
-            -half_t_range.astype('timedelta64[ns]').astype(int),
-            half_t_range.astype('timedelta64[ns]').astype(int),
-            n_ss_timesteps
-            ).astype('timedelta64[ns]')
+        ss_time_offsets = np.arange(n_ss_timesteps) - n_ss_timesteps // 2
+        ss_rtime_vals = ss_time_offsets \
+            * ss_timestep_duration.astype('timedelta64[ns]')
     else:
         ss_rtime_vals = None
 
@@ -197,71 +244,70 @@ def create_xscp_da(
             "Consider setting get_column=True or select a vertical level manually."
         warnings.warn(warning_msg, stacklevel=2)
         background_da = var_da.isel({vert_dimname: 0})
-        
-    
-    # Extract values of data in seascape and
-    # stack them in a seascape_idx dimension
-    ss_list = []
-
-    for _, c_point in c_points.iterrows():
-        c_point_lon = c_point["lon"]
-        c_point_lat = c_point["lat"]
-        sel_dict = dict(
-            lat=slice(
-                c_point_lat-n_ss_gridpoints*gridsize/2,
-                c_point_lat+n_ss_gridpoints*gridsize/2
-                ),
-            lon=slice(
-                c_point_lon-n_ss_gridpoints*gridsize/2,
-                c_point_lon+n_ss_gridpoints*gridsize/2
-                )
-        )
 
-        if seascape_timerange is not None:
-            c_point_time = c_point["time"]
-            sel_dict["time"] = slice(
-                c_point_time-n_ss_timesteps*ss_timestep_duration/2,
-                c_point_time+n_ss_timesteps*ss_timestep_duration/2
-                )
-            
-        seascape = background_da.sel(sel_dict)
-        
-        try:
-            # Change global coords to relative ss coords
-            coord_dict = dict(
-                lat=ss_rlat_vals,
-                lon=ss_rlon_vals
+    if single_precision and background_da.dtype == np.float64:
+        background_da = background_da.astype(np.float32)
+
+    # Order the background's dimensions like the seascapes
+    background_da = background_da.transpose(
+        "lon",
+        "lat",
+        "time",
+        vert_dimname,
+        missing_dims='ignore') # In case there is no time/vertical dimension
+    if load_background:
+        background_arr = background_da.values
+    else:
+        background_arr = background_da.data
+
+    # Index of each seascape's center pixel in the background grid
+    c_lat_idx = np.searchsorted(lat_vals, c_points["lat"].values)
+    c_lon_idx = np.searchsorted(lon_vals, c_points["lon"].values)
+
+    # Indices of every pixel in each seascape, along each gathered dimension
+    ss_indices = [
+        c_lon_idx[:, np.newaxis] + ss_offsets,
+        c_lat_idx[:, np.newaxis] + ss_offsets,
+        ]
+    if seascape_timerange is not None:
+        c_time_idx = np.searchsorted(
+            time_vals,
+            c_points["time"].values.astype(time_vals.dtype)
             )
-            if seascape_timerange is not None:
-                coord_dict["time"] = ss_rtime_vals
-            seascape = seascape.assign_coords(coord_dict)
-            
-        except ValueError:
-            # Add empty seascape to prevent size mismatches later
-            # See issue #7
+        ss_indices.append(c_time_idx[:, np.newaxis] + ss_time_offsets)
+
+    # Extract values of data in all seascapes at once, stacked in a
+    # seascape_idx dimension
+    xscp_data, in_grid = utils.gather_seascapes(background_arr, ss_indices)
+
+    if not in_grid.all():
+        # Add empty seascapes to prevent size mismatches later
+        # See issue #7
+        out_of_grid = c_points.loc[~in_grid, ["lat", "lon"]]
+        for c_lat, c_lon in out_of_grid.itertuples(index=False, name=None):
             warning_msg = "Creating empty seascape for c_point: "\
-                f"(lat={c_point['lat']}, lon={c_point['lon']})." \
+                f"(lat={c_lat}, lon={c_lon})." \
                 "This may be due to the corresponding point being outside " \
                 "var_da's grid or too close to its edge."
             warnings.warn(warning_msg, stacklevel=2)
-            seascape = utils.create_empty_seascape(
-                ss_rlon_vals=ss_rlon_vals,
-                ss_rlat_vals=ss_rlat_vals,
-                ss_rtime_vals=ss_rtime_vals
-            )
-
-        ss_list.append(seascape)
+        if isinstance(xscp_data, np.ndarray) and xscp_data.dtype.kind == "f":
+            # The gather already returned a fresh array, blank it in place
+            # instead of allocating a masked copy
+            xscp_data[~in_grid] = np.nan
+        else:
+            xscp_data = np.where(
+                in_grid.reshape((-1,) + (1,) * (xscp_data.ndim - 1)),
+                xscp_data,
+                np.nan
+                )
 
-    xscp_data = xr.concat(
-        ss_list, 
-        pd.RangeIndex(
-            n_seascapes,
-            name="seascape_idx"
-            )
-        )
+    # Real-world coordinates for each pixel in each ss
+    ss_lon_abs = c_points["lon"].values[:, np.newaxis] + ss_rlon_vals
+    ss_lat_abs = c_points["lat"].values[:, np.newaxis] + ss_rlat_vals
 
     # Construct xr.DataArray
     xscp_coords = {
+            "seascape_idx": np.arange(n_seascapes),
             # Center pixel coordinates for each ss
             "c_lon": ("seascape_idx", c_points["lon"]),
             "c_lat": ("seascape_idx", c_points["lat"]),
@@ -269,14 +315,8 @@ def create_xscp_da(
             "ss_rlon": ("ss_lon", ss_rlon_vals),
             "ss_rlat": ("ss_lat", ss_rlat_vals),
             # Real-world coordinates for each pixel in each ss
-            "ss_lon": (
-                ("seascape_idx","ss_lon"),
-                c_points["lon"].values[:, np.newaxis] + ss_rlon_vals
-                ),
-            "ss_lat": (
-                ("seascape_idx","ss_lat"),
-                c_points["lat"].values[:, np.newaxis] + ss_rlat_vals
-                ),
+            "ss_lon": (("seascape_idx","ss_lon"), ss_lon_abs),
+            "ss_lat": (("seascape_idx","ss_lat"), ss_lat_abs),
         }
     xscp_dims = ["seascape_idx", "ss_lon", "ss_lat"]
     if seascape_timerange is not None:
@@ -295,15 +335,6 @@ def create_xscp_da(
         xscp_dims.append(vert_dimname)
 
     
-    # Make sure the data dimensions are ordered properly
-    xscp_data = xscp_data.transpose(*[
-        "seascape_idx",
-        "lat",
-        "lon",
-        "time",
-        vert_dimname
-        ], missing_dims='ignore') # In case there is no time/vertical dimension
-    
     xscp_attrs = {"seascape_gridsize": gridsize} # See issue #13
     if seascape_timerange is not None:
         xscp_attrs["seascape_timestep"] = ss_timestep_duration
@@ -314,9 +345,11 @@ def create_xscp_da(
         dims=xscp_dims,
         name=f"{var_da.name}",
         attrs = xscp_attrs,
-    ).chunk("auto")
+    )
 
     if compute_result:
-        return xscp_da.compute()
-    else:
-        return xscp_da
\ No newline at end of file
+        # No-op unless the background was left lazy
+        xscp_da = xscp_da.compute()
+    if chunks is not None:
+        xscp_da = xscp_da.chunk(chunks)
+    return xscp_da
\ No newline at end of file
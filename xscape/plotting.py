@@ -1,11 +1,14 @@
 """Plotting functions."""
 
-import matplotlib.pyplot as plt
-import cartopy.crs as ccrs
-from cartopy.mpl.geoaxes import GeoAxes
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
+if TYPE_CHECKING:
+    from cartopy.mpl.geoaxes import GeoAxes
+
 def plot_points(
     points: pd.DataFrame,
     ax:GeoAxes = None
@@ -21,6 +24,10 @@ def plot_points(
         cartopy GeoAxes object on which to plot the points. If none specified,
         uses the currently active matplotlib axes.
     """
+    # Imported here so that importing XScape does not load matplotlib/cartopy
+    import cartopy.crs as ccrs
+    import matplotlib.pyplot as plt
+
     if ax is None:
         ax = plt.gca()
     
@@ -1,5 +1,7 @@
 """Utility functions for XScape."""
 
+import warnings
+
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -20,6 +22,7 @@ def random_datetime64_generator(
     n_datetimes: int,
     start_date: np.datetime64,
     end_date: np.datetime64,
+    rng: np.random.Generator | None = None,
     ) -> np.ndarray:
     """
     Generates an array of random datetime64 values within a given range.
@@ -32,6 +35,12 @@ def random_datetime64_generator(
         The earliest possible datetime.
     end_date : np.datetime64
         The latest possible datetime.
+    rng : np.random.Generator, optional
+        Random number generator to draw from, e.g.
+        `np.random.default_rng(seed)`. If not provided, a new unseeded
+        generator is used. The legacy global state is not used, so
+        `np.random.seed` has no effect: pass a seeded `rng` to get
+        reproducible output.
 
     Returns
     -------
@@ -43,7 +52,9 @@ def random_datetime64_generator(
     end_int = end_date.astype('datetime64[s]').astype(np.int64)
     
     # Generate random integers in the given range
-    random_ints = np.random.randint(start_int, end_int, size=n_datetimes)
+    if rng is None:
+        rng = np.random.default_rng()
+    random_ints = rng.integers(start_int, end_int, size=n_datetimes)
     
     # Convert back to datetime64
     return random_ints.astype('datetime64[s]')
@@ -54,6 +65,7 @@ def generate_points(
     lon_range: tuple,
     lat_range: tuple,
     time_range: tuple | None = None,
+    rng: np.random.Generator | None = None,
     ) -> pd.DataFrame:
     """
     Randomly generates a series of points.
@@ -66,6 +78,12 @@ def generate_points(
         Lat. and lon. ranges defining the area in which to generate points.
     time_range : tuple of np.datetime64, optional
         Range of times to generate timestamps.
+    rng : np.random.Generator, optional
+        Random number generator to draw from, e.g.
+        `np.random.default_rng(seed)`. If not provided, a new unseeded
+        generator is used. The legacy global state is not used, so
+        `np.random.seed` has no effect: pass a seeded `rng` to get
+        reproducible output.
 
     Returns
     -------
@@ -80,47 +98,47 @@ def generate_points(
     min_lon, max_lon = lon_range
     min_lat, max_lat = lat_range
 
+    if rng is None:
+        rng = np.random.default_rng()
+
     # See issue #10
     if min_lat > max_lat:
         lat_range = abs(lat_limit - min_lat) + abs(max_lat - lat_limit)
-        rel_lats = np.random.uniform(0, lat_range, size=(n_points,))
-        lats = np.where(
-            rel_lats <= max_lat,
-            rel_lats - lat_limit,
-            rel_lats + min_lat
-        )
+        # Shift the relative values in a single add, with one offset array
+        lats = rng.uniform(0, lat_range, size=(n_points,))
+        lats += np.where(lats <= max_lat, -lat_limit, min_lat)
     else:
-        lats = np.random.uniform(min_lat, max_lat, size=(n_points,))
+        lats = rng.uniform(min_lat, max_lat, size=(n_points,))
 
     if min_lon > max_lon:
         lon_range = abs(lon_limit - min_lon) + abs(max_lon - lon_limit)
-        rel_lons = np.random.uniform(0, lon_range, size=(n_points,))
-        lons = np.where(
-            rel_lons <= max_lon,
-            rel_lons - lon_limit,
-            rel_lons + min_lon
-        )
+        # Shift the relative values in a single add, with one offset array
+        lons = rng.uniform(0, lon_range, size=(n_points,))
+        lons += np.where(lons <= max_lon, -lon_limit, min_lon)
     else:
-        lons = np.random.uniform(min_lon, max_lon, size=(n_points,))
+        lons = rng.uniform(min_lon, max_lon, size=(n_points,))
     
     points = pd.DataFrame({
         'lat': lats,
         'lon': lons
-    })
+    }, copy=False)
 
     if time_range is not None:
         min_time, max_time = time_range
         points["time"] = random_datetime64_generator(
             n_points,
             min_time, 
-            max_time
+            max_time,
+            rng=rng,
             )
     return points
 
 def get_request_extent(
     points: pd.DataFrame,
     seascape_size: float,
-    gridsize: float
+    gridsize: float,
+    return_slices: bool = False,
+    var_da: xr.DataArray | None = None,
     ) -> dict:
     """
     Calculates the area needed to cover all points and their seascapes.
@@ -133,11 +151,22 @@ def get_request_extent(
         Size (in degrees) of the seascape around each point.
     gridsize : float
         Size (in degrees) of each pixel in the original background field.
+    return_slices : bool, optional
+        Whether to return the extent as "lat" and "lon" slices instead, ready
+        to crop an already loaded background field in a single
+        `var_da.sel(extent)` call. Defaults to False.
+    var_da : xr.DataArray, optional
+        Background field that the slices will crop. If provided, each slice
+        follows the order of the corresponding coordinate in `var_da`.
+        Otherwise, the slices assume ascending lat and lon coordinates and
+        select nothing on descending ones. Only used if `return_slices` is
+        True.
 
     Returns
     -------
     dict
-        `copernicusmarine`-style dictionary of max/min lat/lon.
+        `copernicusmarine`-style dictionary of max/min lat/lon, or dictionary
+        of "lat" and "lon" slices if `return_slices` is True.
 
     See Also
     --------
@@ -148,49 +177,98 @@ def get_request_extent(
         raise ValueError("seascape_size cannot be negative.")
     
     # Sizes in degrees
-    return {
+    extent = {
     'maximum_latitude': points['lat'].max() + gridsize + seascape_size/2,
     'minimum_latitude': points['lat'].min() - gridsize - seascape_size/2,
     'maximum_longitude': points['lon'].max() + gridsize + seascape_size/2,
     'minimum_longitude': points['lon'].min() - gridsize - seascape_size/2,
     }
+    if return_slices:
+        slices = {}
+        for dim, name in (('lat', 'latitude'), ('lon', 'longitude')):
+            bounds = (extent[f'minimum_{name}'], extent[f'maximum_{name}'])
+            # `.sel` slices must follow the order of the coordinate
+            if (var_da is not None) and (var_da.sizes[dim] > 1) \
+                and var_da.indexes[dim].is_monotonic_decreasing:
+                bounds = bounds[::-1]
+            slices[dim] = slice(*bounds)
+        return slices
+    return extent
+
+def find_nearest_gridpoints(
+    values: np.ndarray,
+    grid: np.ndarray,
+    ) -> np.ndarray:
+    """
+    Finds the closest gridpoint to each value in a 1D grid.
+
+    Uses a binary search on the sorted grid, so it runs in O(N log G) for N
+    values and G gridpoints.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values to project onto the grid.
+    grid : np.ndarray
+        1D array of gridpoint coordinates, in any order.
+
+    Returns
+    -------
+    np.ndarray
+        Array with the same shape as `values` containing the closest gridpoint
+        to each value. Ties are resolved towards the lower gridpoint.
+    """
+    sorted_grid = np.sort(grid)
+    right_idx = np.clip(
+        np.searchsorted(sorted_grid, values),
+        1,
+        len(sorted_grid) - 1
+        )
+    left = sorted_grid[right_idx - 1]
+    right = sorted_grid[right_idx]
+    return np.where(values - left <= right - values, left, right)
 
 def get_gridcenter_points(
     points: pd.DataFrame, 
-    var_da: xr.DataArray,
+    lat_vals: np.ndarray,
+    lon_vals: np.ndarray,
+    dedupe: bool = False,
     ) -> pd.DataFrame:
     """
     Gets the corresponding pixel coordinates for a series of points.
 
     Returns a DataFrame with points as rows, which correspond to the coordinates of the
-    pixels of `var_da` in which each point in `points` is.
+    pixels of the grid in which each point in `points` is.
 
     Parameters
     ----------
     points : pd.DataFrame
         DataFrame of points as rows with "lat" and "lon" columns.
-    var_da : xr.DataArray
-        Gridded background field on whose grid to project the points.
+    lat_vals, lon_vals : np.ndarray
+        Latitude and longitude coordinates of the gridded background field on
+        which to project the points.
+    dedupe : bool, optional
+        Whether to drop the rows that end up duplicated, e.g. because two
+        points fall in the same pixel. Defaults to False, which keeps the
+        output row-aligned with `points`.
 
     Returns
     -------
     pd.DataFrame
         A DataFrame in the same format as `points` with the center coordinates
-        of pixels in `var_da`
+        of pixels in the grid.
     """
 
-    # Function to find the nearest grid point
-    def find_nearest(value, grid):
-        return grid[np.abs(grid - value).argmin()]
-
     c_points = points.copy()
-    c_points['lat'] = points['lat'].apply(lambda x: find_nearest(x, var_da['lat'].values))
-    c_points['lon'] = points['lon'].apply(lambda x: find_nearest(x, var_da['lon'].values))
-    return c_points.drop_duplicates()
+    c_points['lat'] = find_nearest_gridpoints(points['lat'].values, lat_vals)
+    c_points['lon'] = find_nearest_gridpoints(points['lon'].values, lon_vals)
+    if dedupe:
+        c_points = c_points.drop_duplicates()
+    return c_points
 
 def get_gridcenter_time(
     dates: pd.DataFrame,
-    var_da: xr.DataArray,
+    time_vals: np.ndarray,
     ) -> pd.DataFrame:
     """
     Gets the nearest time coordinates in a grid for a series of datetime values.
@@ -199,35 +277,30 @@ def get_gridcenter_time(
     ----------
     dates :pd.DataFrame
         DataFrame with a "time" column.
-    var_da : xr.DataArray
-        Gridded data array with a "time" dimension.
+    time_vals : np.ndarray
+        Time coordinates of the gridded background field.
 
     Returns
     -------
     pd.DataFrame
         A DataFrame equivalent to `dates` with the "time" column replaced with
-        the closest available time in `var_da` for each datetime in `dates`.
+        the closest value in `time_vals` for each datetime in `dates`.
         Any duplicate rows after the operation are dropped.
     
     Raises
     ------
     AttributeError
-        If `dates` has no "time" column or if `var_da` has no "time" coordinate.
+        If `dates` has no "time" column.
     """
     
-    # Function to find the nearest time
-    def find_nearest_time(value, time_grid):
-        return time_grid[np.abs(time_grid - np.datetime64(value)).argmin()]
-    
-    if "time" not in var_da.coords:
-        raise AttributeError("No time coordinate found in background DataArray.")
     if "time" not in dates.columns:
         raise AttributeError("No time column found in the provided DataFrame.")
 
     gridded_dates = dates.copy()
-    time_values = var_da["time"].values
-    
-    gridded_dates["time"] = dates["time"].apply(lambda x: find_nearest_time(x, time_values))
+    # Parse times given as strings or date/datetime objects, like
+    # np.datetime64 does for each value
+    time_values = dates["time"].to_numpy().astype("datetime64[ns]")
+    gridded_dates["time"] = find_nearest_gridpoints(time_values, time_vals)
     
     return gridded_dates.drop_duplicates()
 
@@ -280,7 +353,9 @@ def calculate_horizontal_gridsize(
     Calculates the horizontal pixel size of a gridded DataArray.
 
     Automatically calculates the mean of the difference between gridpoints for
-    both lat and lon and then averages those two values.
+    both lat and lon and then averages those two values. The mean spacing is
+    taken directly from the first and last gridpoints, which is equivalent
+    and avoids building the array of differences.
 
     Parameters
     ----------
@@ -297,8 +372,10 @@ def calculate_horizontal_gridsize(
     lat_coord = "ss_rlat" if "ss_lat" in var_da.dims else "lat"
     lon_coord = "ss_rlon" if "ss_lon" in var_da.dims else "lon"
 
-    lat_gridsize = np.diff(var_da[lat_coord].values).mean()
-    lon_gridsize = np.diff(var_da[lon_coord].values).mean()
+    lat_vals = var_da[lat_coord].values
+    lon_vals = var_da[lon_coord].values
+    lat_gridsize = (lat_vals[-1] - lat_vals[0]) / (len(lat_vals) - 1)
+    lon_gridsize = (lon_vals[-1] - lon_vals[0]) / (len(lon_vals) - 1)
     # TODO (#2): Allow different sizes in lat and lon
     gridsize = (lat_gridsize + lon_gridsize) / 2
     return gridsize
@@ -331,6 +408,10 @@ def create_empty_seascape(
     """
     Creates an empty seascape according to prescribed relative coordinates.
 
+    Deprecated: `create_xscp_da` no longer uses it, as it fills seascapes
+    outside of the grid with NaN directly. It will be removed in a future
+    release.
+
     Parameters
     ----------
     ss_rlon_vals , ss_rlat_vals, ss_rtime_vals : np.ndarray
@@ -341,6 +422,12 @@ def create_empty_seascape(
     xr.DataArray
         Seascape-like DataArray filled with NaN values.
     """
+    warnings.warn(
+        "create_empty_seascape is deprecated and will be removed in a future "
+        "release.",
+        DeprecationWarning,
+        stacklevel=2,
+        )
     data = np.full((len(ss_rlon_vals), len(ss_rlat_vals)), np.nan)
     coords = {
         "lon": ss_rlon_vals,
@@ -360,4 +447,111 @@ def create_empty_seascape(
         coords = coords,
         dims = dims,
     )
-    return seascape
\ No newline at end of file
+    return seascape
+
+def gather_seascapes(
+    background_arr: np.ndarray,
+    ss_indices: list[np.ndarray],
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extracts all seascapes from a gridded array in a single gather.
+
+    Parameters
+    ----------
+    background_arr : np.ndarray or dask.array.Array
+        Gridded background field, with the dimensions to gather along first
+        (e.g. lat, lon, time). Any remaining dimensions are kept whole. Dask
+        arrays are gathered lazily.
+    ss_indices : list of np.ndarray
+        One integer array of shape (n_seascapes, n_pixels) per gathered
+        dimension, with the index of each seascape pixel along it.
+
+    Returns
+    -------
+    ss_data : np.ndarray or dask.array.Array
+        Array of shape (n_seascapes, n_pixels_0, n_pixels_1, ...) followed
+        by the remaining dimensions of `background_arr`. Seascapes that are
+        not entirely within the grid are gathered with clipped indices.
+    in_grid : np.ndarray
+        Boolean mask of the seascapes that are entirely within the grid.
+    """
+    n_seascapes = ss_indices[0].shape[0]
+    in_grid = np.ones(n_seascapes, dtype=bool)
+    gather_indices = []
+    for axis, idx in enumerate(ss_indices):
+        axis_len = background_arr.shape[axis]
+        in_grid &= (idx[:, 0] >= 0) & (idx[:, -1] < axis_len)
+        # Shape indices so that they broadcast against each other
+        idx_shape = [n_seascapes] + [1] * len(ss_indices)
+        idx_shape[axis + 1] = idx.shape[1]
+        gather_indices.append(
+            np.clip(idx, 0, axis_len - 1).reshape(idx_shape)
+            )
+    # Dask arrays only support broadcasted index arrays through `.vindex`
+    indexer = getattr(background_arr, "vindex", background_arr)
+    ss_data = indexer[tuple(gather_indices)]
+    return ss_data, in_grid
+
+def interpolate_seascapes(
+    ss_data: np.ndarray,
+    ss_rlat_vals: np.ndarray,
+    ss_rlon_vals: np.ndarray,
+    target_rlat: np.ndarray,
+    target_rlon: np.ndarray,
+    ) -> np.ndarray:
+    """
+    Bilinearly interpolates each seascape at its own set of target points.
+
+    All seascapes are interpolated in a single vectorized pass, which is
+    possible because they share the same relative lat/lon grid.
+
+    Parameters
+    ----------
+    ss_data : np.ndarray
+        Seascapes in an array of shape (n_seascapes, n_lat, n_lon).
+    ss_rlat_vals, ss_rlon_vals : np.ndarray
+        Regularly spaced relative grid shared by all seascapes.
+    target_rlat, target_rlon : np.ndarray
+        Arrays of shape (n_seascapes, n_targets) with the relative coordinates
+        at which to interpolate each seascape.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_seascapes, n_targets) with the interpolated values.
+
+    Raises
+    ------
+    ValueError
+        If any target is outside of the seascape grid.
+    """
+    frac_indices = []
+    for rel_vals, target in (
+        (ss_rlat_vals, target_rlat),
+        (ss_rlon_vals, target_rlon),
+        ):
+        if (target < rel_vals[0]).any() or (target > rel_vals[-1]).any():
+            raise ValueError(
+                "One of the requested points is outside of the seascape grid."
+                )
+        step = rel_vals[1] - rel_vals[0] if len(rel_vals) > 1 else 1
+        frac_indices.append((target - rel_vals[0]) / step)
+
+    # Lower corner of the grid cell containing each target, and the relative
+    # position of the target inside that cell
+    n_seascapes, n_lat, n_lon = ss_data.shape
+    lat_frac, lon_frac = frac_indices
+    lat_0 = np.clip(np.floor(lat_frac).astype(int), 0, max(n_lat - 2, 0))
+    lon_0 = np.clip(np.floor(lon_frac).astype(int), 0, max(n_lon - 2, 0))
+    lat_1 = np.minimum(lat_0 + 1, n_lat - 1)
+    lon_1 = np.minimum(lon_0 + 1, n_lon - 1)
+    lat_w = lat_frac - lat_0
+    lon_w = lon_frac - lon_0
+
+    ss_idx = np.arange(n_seascapes)[:, np.newaxis]
+    return (
+        ss_data[ss_idx, lat_0, lon_0] * (1 - lat_w) * (1 - lon_w)
+        + ss_data[ss_idx, lat_1, lon_0] * lat_w * (1 - lon_w)
+        + ss_data[ss_idx, lat_0, lon_1] * (1 - lat_w) * lon_w
+        + ss_data[ss_idx, lat_1, lon_1] * lat_w * lon_w
+        )